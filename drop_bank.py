@@ -0,0 +1,202 @@
+import os
+import numpy as np
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from network import Network
+from settings import Settings
+from scheduler import allocate_subcarriers
+
+# Arrays attached by each worker process (see `attach_drops`), shared by every task it runs.
+_worker_drops = None
+
+def attach_drops(spec:dict):
+    """
+    Attach to the shared-memory blocks of a drop bank without copying them.
+
+    Args:
+        spec (dict): Mapping of array name to (shared memory name, shape, dtype), as given by `DropBank.spec`.
+
+    Returns:
+        tuple: Dictionary of NumPy views over the shared blocks and the list of attached SharedMemory handles
+            (they must be kept alive while the views are in use).
+    """
+    arrays, handles = {}, []
+    for name, (shm_name, shape, dtype) in spec.items():
+        shm = SharedMemory(name=shm_name)
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        handles.append(shm)
+    return arrays, handles
+
+def _initialize_worker(spec:dict):
+    """
+    Attach the drop bank once per worker process.
+
+    Args:
+        spec (dict): Mapping of array name to (shared memory name, shape, dtype).
+    """
+    global _worker_drops
+    _worker_drops = attach_drops(spec)
+
+def simulate_drops(drops:dict, settings: Settings, type_allocation:str, start:int, stop:int):
+    """
+    Calculate UE capacities for a range of drops with a given scheduler.
+
+    Args:
+        drops (dict): Arrays "positions", "shadow_coefficient" and "path_loss" of the drop bank.
+        settings (Settings): Network and system configuration.
+        type_allocation (str): Resource allocation method ("round-robin" or "sinr").
+        start (int): Index of the first drop.
+        stop (int): Index after the last drop.
+
+    Returns:
+        list: List of capacities (in bps) for each UE, one entry per drop.
+    """
+    capacity = []
+    number_ues = drops["positions"].shape[1]
+    for index_drop in range(start, stop):
+        network = Network(settings=settings, number_ues=number_ues, positions=drops["positions"][index_drop],
+                          shadow_coefficient=drops["shadow_coefficient"][index_drop], path_loss=drops["path_loss"][index_drop])
+        capacity.append(network.calculate_capacity(allocate_subcarriers(network=network, type_allocation=type_allocation)))
+    return capacity
+
+def _simulate_drops_worker(settings: Settings, type_allocation:str, start:int, stop:int):
+    """
+    Run `simulate_drops` over the drop bank attached by the worker process.
+    """
+    return simulate_drops(_worker_drops[0], settings, type_allocation, start, stop)
+
+class DropBank:
+    """
+    Bank of random network drops (UE positions, shadowing and path loss) stored in shared memory.
+    Every scheduler and power allocation strategy is evaluated on the same realizations, and worker
+    processes read them without copying.
+    """
+
+    def __init__(self, number_ues:int, number_drops:int, path_loss_exponent:float, cell_radius:float = 1000,
+                 sigma_shadow_fading:float = 6, cell_center:complex = 0):
+        """
+        Generate the drops and store them in shared memory.
+
+        Args:
+            number_ues (int): Number of user equipments in each drop.
+            number_drops (int): Number of drops (Monte Carlo samples).
+            path_loss_exponent (float): Path loss exponent (e.g., 4 for normal, 5 for urban).
+            cell_radius (float, optional): Cell radius in meters. Defaults to 1000.
+            sigma_shadow_fading (float, optional): Shadowing standard deviation in dB. Defaults to 6.
+            cell_center (complex, optional): Complex coordinate of the cell center. Defaults to 0.
+        """
+        self.number_ues = number_ues
+        self.number_drops = number_drops
+        self.path_loss_exponent = path_loss_exponent
+        self.cell_radius = cell_radius
+        self.sigma_shadow_fading = sigma_shadow_fading
+        self.cell_center = cell_center
+        self._handles = []
+        self.drops = {
+            "positions": self._allocate((number_drops, number_ues), np.complex128),
+            "shadow_coefficient": self._allocate((number_drops, number_ues), np.float64),
+            "path_loss": self._allocate((number_drops, number_ues, 7), np.float64)
+        }
+        self.generate_drops()
+
+    def _allocate(self, shape:tuple, dtype):
+        """
+        Create a shared-memory block and return a NumPy view over it.
+
+        Args:
+            shape (tuple): Shape of the array.
+            dtype (np.dtype): Data type of the array.
+
+        Returns:
+            np.ndarray: Array backed by the new shared-memory block.
+        """
+        shm = SharedMemory(create=True, size=max(1, int(np.prod(shape))*np.dtype(dtype).itemsize))
+        self._handles.append(shm)
+        return np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+    def generate_drops(self):
+        """
+        Generate UE positions, shadow fading and path loss for every drop.
+        """
+        settings = self.settings(number_subcarriers=1)
+        for index_drop in range(self.number_drops):
+            network = Network(settings=settings, number_ues=self.number_ues)
+            self.drops["positions"][index_drop] = network.user_equipaments.positions
+            self.drops["shadow_coefficient"][index_drop] = network.shadow_coefficient
+            self.drops["path_loss"][index_drop] = network.calculate_path_loss()
+
+    def settings(self, number_subcarriers:int, power_allocation_strategy:str = "uniform"):
+        """
+        Build the network settings matching the drops of the bank.
+
+        Args:
+            number_subcarriers (int): Total number of subcarriers in the system.
+            power_allocation_strategy (str, optional): Power allocation method ("uniform" or "inverse_pathloss"). Defaults to "uniform".
+
+        Returns:
+            Settings: Network settings.
+        """
+        return Settings(number_subcarriers=number_subcarriers, path_loss_exponent=self.path_loss_exponent, cell_radius=self.cell_radius,
+                        sigma_shadow_fading=self.sigma_shadow_fading, cell_center=self.cell_center, power_allocation_strategy=power_allocation_strategy)
+
+    @property
+    def spec(self):
+        """
+        Description of the shared-memory blocks used by `attach_drops`.
+
+        Returns:
+            dict: Mapping of array name to (shared memory name, shape, dtype).
+        """
+        return {name: (shm.name, array.shape, array.dtype.str) for (name, array), shm in zip(self.drops.items(), self._handles)}
+
+    def compare(self, subcarriers:list, schedulers:list, power_strategies:list, number_processes:int = None):
+        """
+        Calculate UE capacities for every combination of subcarriers, power allocation strategy and scheduler
+        over the same drops.
+
+        Args:
+            subcarriers (list): Numbers of subcarriers to analyze.
+            schedulers (list): Resource allocation methods (e.g., "round-robin", "sinr").
+            power_strategies (list): Power allocation methods (e.g., "uniform", "inverse_pathloss").
+            number_processes (int, optional): Number of worker processes. If 1, runs in the current process.
+                If None, uses the number of CPUs. Defaults to None.
+
+        Returns:
+            dict: Nested dictionary {subcarriers: {power strategy: {scheduler: capacities}}}, where capacities is a
+                list of capacities (in bps) for each UE, one entry per drop.
+        """
+        combinations = [(number_subcarriers, power_strategy, scheduler) for number_subcarriers in subcarriers
+                        for power_strategy in power_strategies for scheduler in schedulers]
+        output = {number_subcarriers: {power_strategy: {} for power_strategy in power_strategies} for number_subcarriers in subcarriers}
+
+        if number_processes == 1:
+            for number_subcarriers, power_strategy, scheduler in combinations:
+                output[number_subcarriers][power_strategy][scheduler] = simulate_drops(
+                    self.drops, self.settings(number_subcarriers, power_strategy), scheduler, 0, self.number_drops)
+            return output
+
+        number_processes = number_processes or os.cpu_count()
+        chunk_size = max(1, -(-self.number_drops // (4*number_processes)))
+        with Pool(processes=number_processes, initializer=_initialize_worker, initargs=(self.spec,)) as pool:
+            chunks = [(start, min(start + chunk_size, self.number_drops)) for start in range(0, self.number_drops, chunk_size)]
+            results = {combination: [pool.apply_async(_simulate_drops_worker, (self.settings(*combination[:2]), combination[2], start, stop))
+                                     for start, stop in chunks] for combination in combinations}
+            for (number_subcarriers, power_strategy, scheduler), chunk_results in results.items():
+                output[number_subcarriers][power_strategy][scheduler] = [capacity for result in chunk_results for capacity in result.get()]
+        return output
+
+    def close(self):
+        """
+        Release and remove the shared-memory blocks of the bank.
+        """
+        self.drops = {}
+        for shm in self._handles:
+            shm.close()
+            shm.unlink()
+        self._handles = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
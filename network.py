@@ -9,17 +9,22 @@ class Network:
     shadowing, interference, SINR, and capacity calculations for multiple User Equipments (UEs) within a cell.
     """
     
-    def __init__(self, settings: Settings, number_ues:int): 
+    def __init__(self, settings: Settings, number_ues:int, positions:np.ndarray=None, shadow_coefficient:np.ndarray=None, path_loss:np.ndarray=None): 
         """
         Initialize the Network with given settings and UEs.
 
         Args:
             settings (Settings): Network and simulation parameters.
             number_ues (int): Number of user equipments in the cell.
+            positions (np.ndarray, optional): Pre-generated UE positions. If None, random positions are generated. Defaults to None.
+            shadow_coefficient (np.ndarray, optional): Pre-generated shadow fading values in dB. If None, they are generated. Defaults to None.
+            path_loss (np.ndarray, optional): Pre-computed path loss matrix in dB with shape (number_ues, 7), see `calculate_path_loss`. 
+                If None, path loss is computed on demand. Defaults to None.
         """
         self.settings = settings
-        self.shadow_coefficient = self.generate_shadow_coefficient(number_ues=number_ues)
-        self.user_equipaments = UserEquipments(number_ues=number_ues, cell_radius=settings.cell_radius, cell_center=settings.cell_center)
+        self.path_loss = path_loss
+        self.shadow_coefficient = self.generate_shadow_coefficient(number_ues=number_ues) if shadow_coefficient is None else shadow_coefficient
+        self.user_equipaments = UserEquipments(number_ues=number_ues, cell_radius=settings.cell_radius, cell_center=settings.cell_center, positions=positions)
         self.transmition_power_dbm = self.calculate_transmition_power(number_ues=number_ues)
 
     def calculate_transmition_power(self, number_ues:int):
@@ -65,10 +70,24 @@ class Network:
         Returns:
             float: Path loss in dBm.
         """
+        if self.path_loss is not None: 
+            return self.path_loss[index_ue, 0 if index_bs_inteferente is None else index_bs_inteferente + 1]
+
         distance = self.settings.calculate_distance(
             position=self.user_equipaments.positions[index_ue], index_bs_inteferente=index_bs_inteferente)
         return 130 + 10*self.settings.path_loss_exponent*np.log10(distance/1000) + self.shadow_coefficient[index_ue]
     
+    def calculate_path_loss(self): 
+        """
+        Calculate path loss for all UEs relative to the serving BS and the 6 interfering BSs.
+
+        Returns:
+            np.ndarray: Path loss matrix in dB with shape (number_ues, 7). Column 0 is the serving BS 
+                and columns 1-6 are the interfering BSs.
+        """
+        return np.array([[self.path_loss_per_ue(index_ue=index_ue, index_bs_inteferente=index_bs) for index_bs in [None, *range(6)]]
+                         for index_ue in range(self.user_equipaments.number_ues)])
+    
     def received_power_per_ue(self, index_ue:int, index_bs_inteferente:float=None): 
         """
         Calculate received power at a UE from the serving or interfering BS.
@@ -51,3 +51,22 @@ def max_sinr_allocation(value_sinr:list, number_subcarriers:int):
     
     return subcarriers_allocation
 
+def allocate_subcarriers(network: Network, type_allocation:str="round-robin"):
+    """
+    Allocate the subcarriers of a network among its UEs using the selected scheduler.
+
+    Args:
+        network (Network): Network whose UEs receive the subcarriers.
+        type_allocation (str, optional): Resource allocation method ("round-robin" or "sinr"). Defaults to "round-robin".
+
+    Returns:
+        list: Number of subcarriers allocated to each UE.
+    """
+    number_subcarriers = network.settings.number_subcarriers
+    if type_allocation.lower() == "round-robin": 
+        return round_robin_allocation(number_ues=network.user_equipaments.number_ues, number_subcarriers=number_subcarriers)
+    
+    elif type_allocation.lower() == "sinr": 
+        return max_sinr_allocation(value_sinr=network.calculate_sinr(), number_subcarriers=number_subcarriers)
+    else:
+        raise ValueError(f"Unknown scheduler: {type_allocation}")
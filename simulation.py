@@ -3,8 +3,9 @@ import numpy as np
 from network import Network
 from settings import Settings
 from graphic import graphic_cdf
+from drop_bank import DropBank
 from utils import simulation_monte_carlo
-from scheduler import round_robin_allocation, max_sinr_allocation
+from scheduler import allocate_subcarriers
 
 def analysis_scheduler(number_ues:int, settings: Settings, type_allocation:str="round-robin"): 
     """
@@ -20,15 +21,11 @@ def analysis_scheduler(number_ues:int, settings: Settings, type_allocation:str="
     """
 
     network = Network(settings=settings, number_ues=number_ues)
-    if type_allocation.lower() == "round-robin": 
-        subcarriers_allocation = round_robin_allocation(number_ues=number_ues, number_subcarriers=settings.number_subcarriers)
-    else:
-        value_sinr = network.calculate_sinr()
-        subcarriers_allocation = max_sinr_allocation(value_sinr=value_sinr, number_subcarriers=settings.number_subcarriers)
-
+    subcarriers_allocation = allocate_subcarriers(network=network, type_allocation=type_allocation)
     return network.calculate_capacity(subcarriers_allocation)
 
-def analysis_per_scheduler(number_ues:int, path_loss_exponent:int, cell_radius:int, power_strategy:str, verbose:bool=False):
+def analysis_per_scheduler(number_ues:int, path_loss_exponent:int, cell_radius:int, power_strategy:str, verbose:bool=False, 
+                           number_processes:int=None):
     """
     Run Monte Carlo simulations to analyze capacity performance under different 
     scheduling and power allocation strategies.
@@ -37,8 +34,11 @@ def analysis_per_scheduler(number_ues:int, path_loss_exponent:int, cell_radius:i
         number_ues (int): Number of UEs in the simulation.
         path_loss_exponent (int): Path loss exponent (e.g., 4 for normal, 5 for urban).
         cell_radius (int): Cell radius in meters. Defaults to 1000.
+        power_strategy (str): Power allocation method ("uniform" or "inverse_pathloss").
         verbose (bool, optional): If True, prints percentiles (10th, 50th, 90th) for 
             per-UE and total capacity. Defaults to False.
+        number_processes (int, optional): Number of worker processes used by the drop bank. If 1, runs in the 
+            current process. If None, uses the number of CPUs. Defaults to None.
 
     Returns:
          dict: A nested dictionary with simulation results for each combination of subcarriers, 
@@ -48,22 +48,20 @@ def analysis_per_scheduler(number_ues:int, path_loss_exponent:int, cell_radius:i
         - Schedulers analyzed: Round-Robin and Max-SINR.
         - Power allocation strategies analyzed: Uniform Power and Inverse Pathloss Power.
         - Each simulation runs 1e3 Monte Carlo samples by default.
+        - All schedulers and numbers of subcarriers are evaluated over the same drops (see `DropBank`).
     """
     output = {}
     schedulers = {"Round-Robin": "round-robin", "Max-SINR": "sinr"}
     power_strategy_name = "Uniform Power" if power_strategy == "uniform" else "Inverse Pathloss Power"
     
+    with DropBank(number_ues=number_ues, number_drops=int(1e3), path_loss_exponent=path_loss_exponent, cell_radius=cell_radius) as drop_bank:
+        capacity_per_scheduler = drop_bank.compare(subcarriers=[32, 64, 128], schedulers=list(schedulers.values()), 
+                                                   power_strategies=[power_strategy], number_processes=number_processes)
+    
     for subcarriers in [32, 64, 128]: 
         output_scheduler = {}
         for scheduler_name, scheduler in schedulers.items():
-            settings = Settings(number_subcarriers=subcarriers, path_loss_exponent=path_loss_exponent,
-                                cell_radius=cell_radius, power_allocation_strategy=power_strategy)
-
-            capacity = simulation_monte_carlo(
-                function=analysis_scheduler,
-                number_simulation=int(1e3),
-                **{'settings': settings, 'number_ues': number_ues, 'type_allocation': scheduler}
-            )
+            capacity = capacity_per_scheduler[subcarriers][power_strategy][scheduler]
             
             capacity_total = [sum(sublist)/1e6 for sublist in capacity]
             capacity_individual = [item/1e6 for sublist in capacity for item in sublist]
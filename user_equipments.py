@@ -6,7 +6,7 @@ class UserEquipments:
     Generates and stores random UE positions within a circular cell.
     """ 
     
-    def __init__(self, number_ues:int, cell_radius:float, cell_center:complex):
+    def __init__(self, number_ues:int, cell_radius:float, cell_center:complex, positions:np.ndarray=None):
         """
         Initialize the UserEquipments class.
 
@@ -14,9 +14,10 @@ class UserEquipments:
             number_ues (int): Number of user equipments in the cell.
             cell_radius (float): Cell radius in meters.
             cell_center (complex): Position of the cell center.
+            positions (np.ndarray, optional): Pre-generated UE positions. If None, random positions are generated. Defaults to None.
         """
         self.number_ues = number_ues
-        self.positions = self.generate_position(cell_radius, cell_center)
+        self.positions = self.generate_position(cell_radius, cell_center) if positions is None else positions
 
     def generate_position(self, cell_radius:float, cell_center:complex): 
         """